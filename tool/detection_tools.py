@@ -2,9 +2,9 @@
 
 from typing import Literal, Annotated
 from pydantic import Field, IPvAnyAddress
-import json
 import base64
 
+from utils.fast_json import dumps as _dumps
 from utils.validators import validate_date_range
 
 class DetectionMCPTools:
@@ -51,7 +51,7 @@ class DetectionMCPTools:
             # Get detection details
             detection = await self.client.get_detection(detection_id)
             
-            return json.dumps(detection)
+            return _dumps(detection)
         except Exception as e:
             raise Exception(f"Failed to retrieve details for detection {detection_id}: {str(e)}")
 
@@ -137,7 +137,7 @@ class DetectionMCPTools:
                 response["note"] = f"Results limited to {limit} detections. Total detections found: {total_count}."
                 response["detections"] = detections
             
-        return json.dumps(response, indent=2)
+        return _dumps(response)
 
     async def get_detection_count(
         self,
@@ -258,7 +258,7 @@ class DetectionMCPTools:
             if not detections:
                 return f"No detections found for entity ID {entity_id}."
             
-            return json.dumps({"detection_count": total_count, "detections": detections}, indent=2)
+            return _dumps({"detection_count": total_count, "detections": detections})
         
         except Exception as e:
             raise Exception(f"Failed to list detections for entity {entity_id}: {str(e)}")
@@ -346,7 +346,7 @@ class DetectionMCPTools:
                 response["note"] = f"Results limited to {limit} detections. Total detections found: {total_count}."
                 response["detections"] = detection_list
             
-        return json.dumps(response, indent=2)
+        return _dumps(response)
     
     async def get_detection_summary(
         self,
@@ -377,7 +377,7 @@ class DetectionMCPTools:
                 "detection_summary": detection.get("summary", "No summary available"),
             }
             
-            return json.dumps(detection_summary, indent=2)
+            return _dumps(detection_summary)
         
         except Exception as e:
             raise Exception(f"Failed to retrieve detection summary: {str(e)}")
@@ -472,4 +472,4 @@ class DetectionMCPTools:
                 response["note"] = f"Results limited to {limit} detections. Total detections found: {total_count}."
                 response["detections_ids"] = detection_ids
             
-        return json.dumps(response, indent=2)
\ No newline at end of file
+        return _dumps(response)
\ No newline at end of file
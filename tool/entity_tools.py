@@ -2,7 +2,8 @@
 
 from typing import Literal, Annotated
 from pydantic import Field, IPvAnyAddress
-import json
+
+from utils.fast_json import dumps as _dumps
 
 class EntityMCPTools:
     """MCP tools for entity (host or account) analysis and management."""
@@ -94,7 +95,7 @@ class EntityMCPTools:
             if limit and len(entities) > limit:
                 entities = entities[:limit]
             # Format the response as a JSON string
-            return json.dumps({"total_count": total_count, "entities": entities}, indent=2)
+            return _dumps({"total_count": total_count, "entities": entities})
         except Exception as e:
             raise Exception(f"Failed to fetch entities: {str(e)}")
      
@@ -120,7 +121,7 @@ class EntityMCPTools:
             if 'detail' in account_details and account_details['detail'] == 'Not found.':
                 return f"No account found with ID: {account_id}."
             
-            return json.dumps(account_details, indent=2)
+            return _dumps(account_details)
         except Exception as e:
             raise Exception(f"Failed to fetch account details: {str(e)}")
         
@@ -162,7 +163,7 @@ class EntityMCPTools:
                 for entity in entity_match_list
             ]
 
-            return json.dumps({"match_count": entity_match_count, "matched_entities": entity_lookup_result}, indent=2)
+            return _dumps({"match_count": entity_match_count, "matched_entities": entity_lookup_result})
 
         except Exception as e:
             raise Exception(f"Failed to fetch entity info: {str(e)}")
@@ -186,7 +187,7 @@ class EntityMCPTools:
             if 'detail' in host_details and host_details['detail'] == 'Not found.':
                 return f"No host found with ID: {host_id}."
             
-            return json.dumps(host_details, indent=2)
+            return _dumps(host_details)
         except Exception as e:
             raise Exception(f"Failed to fetch host details: {str(e)}")
         
@@ -217,7 +218,7 @@ class EntityMCPTools:
 
                 for host in all_hosts:
                     if host.get('ip') == str(host_ip):
-                        return json.dumps({"matched_host" : host}, indent=2)
+                        return _dumps({"matched_host" : host})
             
             # If no match found in any state, return not found message
             return f"No hosts found associated with IP address: {host_ip}."
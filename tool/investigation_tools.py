@@ -1,11 +1,100 @@
 """MCP tools for security investigations."""
 
-from typing import Literal, List, Annotated
+from typing import Literal, List, Annotated, Final
 from pydantic import Field
-import json
+from mcp.server.fastmcp import Context
+import asyncio
+import base64
+import time
+import msgpack
+import orjson
 
+from utils.fast_json import dumps as _dumps
+from utils.logging import get_logger
 from utils.validators import validate_date_range
 
+logger = get_logger(__name__)
+
+# Maximum detection IDs per mark-fixed request; large lists are split into
+# chunks of this size and sent concurrently.
+MARK_FIXED_CHUNK_SIZE = 100
+
+# How long cached assignment lookups stay valid, in seconds. LLM-driven
+# exploration tends to re-fetch the same IDs within a short window.
+ASSIGNMENT_CACHE_TTL = 30.0
+
+# Upper bound on cached lookups; oldest entries are evicted beyond this so
+# a long-running server cannot accumulate response strings without limit.
+ASSIGNMENT_CACHE_MAX_ENTRIES = 128
+
+# Above this many entity IDs, get_assignment_for_entity fans out into
+# concurrent per-entity queries instead of one giant CSV filter.
+PARALLEL_FETCH_THRESHOLD = 50
+
+# Immutable status strings, hoisted so they are not rebuilt per call.
+NO_ASSIGNMENTS = "No assignments found."
+NO_DETECTION_IDS = "No detection IDs provided."
+MARKED_TEMPLATE = "Marked {n} detections as {state}."
+
+# Shared parameter descriptors, built once at import time instead of being
+# recreated per method definition.
+RESOLVED_FIELD: Final = Field(description="Filter assignments by resolved state. True for resolved, False for unresolved. Default is False to retrieve only unresolved/open assignments.")
+ACCEPT_MSGPACK_FIELD: Final = Field(description="Return the result as base64-encoded MessagePack instead of JSON. Only set to True if the client can decode MessagePack. Default is False.")
+ASSIGNMENT_ID_FIELD: Final = Field(ge=1, description="ID of the assignment")
+ENTITY_IDS_FIELD: Final = Field(description="List of entity IDs to retrieve assignment for")
+EntityType = Annotated[
+    Literal["host", "account"],
+    Field(description="Type of entity (host or account)")
+]
+
+# Maps an entity type to its assignments query parameter.
+ENTITY_QUERY_KEY = {"host": "hosts", "account": "accounts"}
+
+# Tool method names registered with the MCP server, in registration order.
+TOOLS = (
+    "create_assignment",
+    "list_assignments",
+    "list_assignments_for_user",
+    "delete_assignment",
+    "get_assignment_detail_by_id",
+    "get_assignment_for_entity",
+    "create_entity_note",
+    "mark_detection_fixed",
+)
+
+PAGE_FIELD: Final = Field(ge=1, description="Page number to retrieve. Default is None to retrieve the first page.")
+PAGE_SIZE_FIELD: Final = Field(ge=1, le=1000, description="Maximum number of assignments per page. Use this to keep response sizes bounded. Default is None for the server default.")
+FIELDS_FIELD: Final = Field(description="Comma-separated list of assignment fields to return (e.g. 'id,assigned_to,resolved'). Restricting fields shrinks both the response and parse time. Default is None for all fields.")
+
+
+def _csv_ints(ids: List[int]) -> str:
+    """Format integers as comma-separated values.
+
+    orjson renders the JSON array in C; slicing off the brackets leaves the
+    CSV form, far faster than ",".join(map(str, ids)) for large lists.
+    """
+    return orjson.dumps(ids).decode()[1:-1]
+
+
+def _iso(dt) -> str:
+    """Format a datetime as an ISO-8601 string.
+
+    Goes through orjson's C RFC 3339 formatter (stripping the JSON quotes)
+    instead of the pure-Python datetime.isoformat.
+    """
+    return orjson.dumps(dt).decode()[1:-1]
+
+
+def _packb(obj) -> str:
+    """Serialize an object to base64-encoded MessagePack.
+
+    Roughly half the on-wire size of JSON for id-heavy payloads, with no
+    string escaping. Base64-wrapped because MCP tool results are text
+    content (same approach as the pcap tool).
+    """
+    return base64.b64encode(msgpack.packb(obj, use_bin_type=True)).decode('ascii')
+
+
 class InvestigationMCPTools:
     """MCP tools for investigations."""
     
@@ -18,85 +107,157 @@ class InvestigationMCPTools:
         """
         self.vectra_mcp = vectra_mcp
         self.client = client
-    
+        # Serialized responses of recent assignment lookups, keyed by query
+        # tuple: {key: (expires_at, response)}.
+        self._assignment_cache: dict[tuple, tuple[float, str]] = {}
+        # Dispatch tables for the two-value Literal parameters, built once so
+        # the per-call branches become single dict lookups.
+        self._entity_query_key = ENTITY_QUERY_KEY
+        self._create_assign_key = {"account": "assign_account_id", "host": "assign_host_id"}
+        self._mark_state = {True: "fixed", False: "not fixed"}
+
+    def _cache_get(self, key: tuple) -> str | None:
+        """Return a cached response for key, or None if absent/expired."""
+        entry = self._assignment_cache.get(key)
+        if entry is not None:
+            expires_at, response = entry
+            if time.monotonic() < expires_at:
+                return response
+            del self._assignment_cache[key]
+        return None
+
+    def _cache_put(self, key: tuple, response: str) -> None:
+        """Cache a serialized response for ASSIGNMENT_CACHE_TTL seconds.
+
+        Sweeps expired entries and evicts the oldest ones so the cache
+        stays bounded at ASSIGNMENT_CACHE_MAX_ENTRIES.
+        """
+        now = time.monotonic()
+        cache = self._assignment_cache
+
+        # Drop already-expired entries so they don't linger until their key
+        # happens to be looked up again
+        for stale_key in [k for k, (expires_at, _) in cache.items() if expires_at <= now]:
+            del cache[stale_key]
+
+        # Evict oldest entries (dicts preserve insertion order) to stay
+        # within the size bound
+        while len(cache) >= ASSIGNMENT_CACHE_MAX_ENTRIES:
+            del cache[next(iter(cache))]
+
+        cache[key] = (now + ASSIGNMENT_CACHE_TTL, response)
+
+    def _invalidate_assignment_cache(self) -> None:
+        """Drop all cached assignment lookups after a write operation."""
+        self._assignment_cache.clear()
+
     def register_tools(self):
         """Register all investigation tools with the MCP server."""
-        self.vectra_mcp.tool()(self.create_assignment)
-        self.vectra_mcp.tool()(self.list_assignments)
-        self.vectra_mcp.tool()(self.list_assignments_for_user)
-        self.vectra_mcp.tool()(self.delete_assignment)
-        self.vectra_mcp.tool()(self.get_assignment_detail_by_id)
-        self.vectra_mcp.tool()(self.get_assignment_for_entity)
-        self.vectra_mcp.tool()(self.create_entity_note)
-        self.vectra_mcp.tool()(self.mark_detection_fixed)
+        # Build the decorator once instead of once per tool
+        tool = self.vectra_mcp.tool()
+        for name in TOOLS:
+            tool(getattr(self, name))
 
     async def list_assignments(
             self,
-            resolved: Annotated[
-                bool, 
-                Field(description="Filter assignments by resolved state. True for resolved, False for unresolved. Default is False.")
-            ] = False,
+            resolved: Annotated[bool, RESOLVED_FIELD] = False,
             created_after: Annotated[
                 str | None,
                 Field(description="Use this to list assignments created at or after this time stamp (YYYY-MM-DDTHH:MM:SS)")
-            ] = None
+            ] = None,
+            page: Annotated[int | None, PAGE_FIELD] = None,
+            page_size: Annotated[int | None, PAGE_SIZE_FIELD] = None,
+            accept_msgpack: Annotated[bool, ACCEPT_MSGPACK_FIELD] = False,
+            ctx: Context = None
         ) -> str:
         """
         List all investigation assignments with optional filtering by timestamp and resolved state.
-        
+
         Returns:
             str: JSON string with list of assignments.
         """
         try:
             search_params = {"resolved" : resolved}
 
+            if page_size is not None:
+                search_params["page_size"] = page_size
+
             # Validate and convert date strings to datetime objects
             start_date, end_date = validate_date_range(created_after, None)
             if start_date:
-                search_params["created_after"] = start_date.isoformat()
+                search_params["created_after"] = _iso(start_date)
 
-            assignments = await self.client.get_assignments(**search_params)
+            if page is not None or accept_msgpack:
+                # Explicit page or binary encoding: single request
+                if page is not None:
+                    search_params["page"] = page
+
+                assignments = await self.client.get_assignments(**search_params)
+
+                if assignments is None:
+                    return NO_ASSIGNMENTS
+                if accept_msgpack:
+                    return _packb(assignments)
+                return _dumps(assignments)
+
+            # Stream pages: serialize each page as soon as it arrives and
+            # stitch the compact fragments, so peak memory holds one parsed
+            # page instead of the whole collection, and clients see progress
+            # at first-page latency instead of full-response latency.
+            chunks = []
+            total = 0
+            async for page_data in self.client.iter_assignments(**search_params):
+                results = page_data.get("results", [])
+                total += len(results)
+                if results:
+                    # Strip the brackets so page fragments join into one array
+                    chunks.append(orjson.dumps(results, default=str).decode()[1:-1])
+                if ctx is not None:
+                    await ctx.report_progress(total, page_data.get("count"))
+
+            if total == 0:
+                return NO_ASSIGNMENTS
+            return f'{{"count": {total}, "results": [{",".join(chunks)}]}}'
+        except Exception:
+            logger.exception("Failed to list assignments")
+            raise
 
-            if assignments is None:
-                return "No assignments found."
-            return json.dumps(assignments, indent=2)
-        except Exception as e:
-            raise Exception(f"Failed to list assignments: {str(e)}")
-        
     async def list_assignments_for_user(
             self,
             user_id: Annotated[
                 int, 
                 Field(description="Vectra platform user ID to retrieve assignments for.")
             ],
-            resolved: Annotated[
-                bool, 
-                Field(description="Filter assignments by resolved state. True for resolved, False for unresolved. Default is False to retrieve only unresolved/open assignments.")
-            ] = False,
+            resolved: Annotated[bool, RESOLVED_FIELD] = False,
+            page: Annotated[int | None, PAGE_FIELD] = None,
+            page_size: Annotated[int | None, PAGE_SIZE_FIELD] = None,
+            accept_msgpack: Annotated[bool, ACCEPT_MSGPACK_FIELD] = False,
         ) -> str:
         """
         List all investigation assignments assigned to a user/analyst.
-        
+
         Returns:
             str: JSON string with list of assignments.
         """
         try:
             assignments = await self.client.get_assignments(
                 assignee = user_id,
-                resolved = resolved
+                resolved = resolved,
+                page = page,
+                page_size = page_size
                 )
             if assignments is None:
-                return "No assignments found."
-            return json.dumps(assignments, indent=2)
-        except Exception as e:
-            raise Exception(f"Failed to list assignments: {str(e)}")
-        
+                return NO_ASSIGNMENTS
+            if accept_msgpack:
+                return _packb(assignments)
+            return _dumps(assignments)
+        except Exception:
+            logger.exception("Failed to list assignments for user %s", user_id)
+            raise
+
     async def get_assignment_detail_by_id(
         self,
-        assignment_id: Annotated[
-            int,
-            Field(ge=1, description="ID of the assignment to retrieve")
-        ]    
+        assignment_id: Annotated[int, ASSIGNMENT_ID_FIELD]
     ) -> str:
         """
         Retrieve details of a specific investigation assignment.
@@ -107,22 +268,26 @@ class InvestigationMCPTools:
             Exception: If fetching assignment details fails.
         """
         try:
+            cache_key = ("assignment", assignment_id)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
             assignment_details = await self.client.get_assignment(assignment_id)
 
-            return json.dumps(assignment_details, indent=2)
-        except Exception as e:
-            raise Exception(f"Failed to list assignment : {assignment_id}: {str(e)}")
+            response = _dumps(assignment_details)
+            self._cache_put(cache_key, response)
+            return response
+        except Exception:
+            logger.exception("Failed to retrieve assignment %s", assignment_id)
+            raise
         
     async def get_assignment_for_entity(
         self,
-        entity_ids: Annotated[
-            List[int], 
-            Field(description="List of entity IDs to retrieve assignment for")
-        ],
-        entity_type: Annotated[
-            Literal["host", "account"], 
-            Field(description="Type of entity to retrieve assignment for (host or account)")
-        ]
+        entity_ids: Annotated[List[int], ENTITY_IDS_FIELD],
+        entity_type: EntityType,
+        fields: Annotated[str | None, FIELDS_FIELD] = None,
+        accept_msgpack: Annotated[bool, ACCEPT_MSGPACK_FIELD] = False
     ) -> str:
         """
         Retrieve investigation assignment for a specific account.
@@ -133,27 +298,45 @@ class InvestigationMCPTools:
             Exception: If fetching assignment fails.
         """
         try:
-            if entity_type not in ["host", "account"]:
-                raise ValueError("entity_type must be either 'host' or 'account'.")
-            
-            if entity_type == "host":
-                search_params = {
-                    "hosts": ",".join(map(str, entity_ids)) # stitch entity ids separated by commas
-                }
+            cache_key = (entity_type, tuple(sorted(entity_ids)), fields, accept_msgpack)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+            # entity_type is already constrained by the Literal annotation;
+            # pick the query key by lookup instead of branching
+            query_key = self._entity_query_key[entity_type]
+
+            if len(entity_ids) > PARALLEL_FETCH_THRESHOLD:
+                # One huge IN-list filter defeats server-side caching and
+                # scales poorly; small per-entity queries are individually
+                # cacheable and can run concurrently over the pooled client.
+                pages = await asyncio.gather(
+                    *(self.client.get_assignments(**{query_key: str(entity_id)}, fields=fields)
+                      for entity_id in entity_ids)
+                )
+                results = [a for page in pages for a in page.get("results", [])]
+                assignments = {"count": len(results), "results": results}
             else:
-                search_params = {
-                    "accounts": ",".join(map(str, entity_ids)) # stitch entity ids separated by commas
-                }
-            
-            # Fetch assignments for the entity
-            assignments = await self.client.get_assignments(**search_params)
+                search_params = {query_key: _csv_ints(entity_ids)}
+                if fields:
+                    search_params["fields"] = fields
+
+                # Fetch assignments for the entity
+                assignments = await self.client.get_assignments(**search_params)
 
             if not assignments['results']:
                 return f"No assignments found for {entity_type}: {entity_ids}."
-            
-            return json.dumps(assignments['results'], indent=2)
-        except Exception as e:
-            raise Exception(f"Failed to fetch assignment for {entity_type}: {entity_ids}: {str(e)}")
+
+            if accept_msgpack:
+                response = _packb(assignments['results'])
+            else:
+                response = _dumps(assignments['results'])
+            self._cache_put(cache_key, response)
+            return response
+        except Exception:
+            logger.exception("Failed to fetch assignment for %s: %s", entity_type, entity_ids)
+            raise
     
     async def create_assignment(
         self,
@@ -179,37 +362,33 @@ class InvestigationMCPTools:
             Exception: If assignment creation fails.
         """
 
-        # Prepare assignment data
+        # Build the payload in one dict literal; only the entity key differs
+        entity_key = self._create_assign_key[assign_entity_type]
         assignment_data = {
             "assign_to_user_id": assign_to_user_id,
+            entity_key: assign_entity_id,
         }
 
-        # Create payload based on entity type
-        if assign_entity_type == "account":
-            assignment_data["assign_account_id"] = assign_entity_id
-        else:
-            assignment_data["assign_host_id"] = assign_entity_id
-
         try:
             # Create the assignment
-            assignment = await self.client.delete_assignment(assignment_data)
-            assignment_id = assignment.get("assignment").get("id")
-            
+            assignment = await self.client.create_assignment(assignment_data)
+
+            # Assignments changed; cached lookups are stale
+            self._invalidate_assignment_cache()
+
             # Return assignment details
-            return json.dumps(assignment)
+            return _dumps(assignment)
             
-        except Exception as e:
-            raise Exception(f"Failed to create assignment: {str(e)}")
+        except Exception:
+            logger.exception("Failed to create assignment")
+            raise
         
     async def create_entity_note(
             self,
             entity_id: Annotated[
                 int, Field(ge=1, description="ID of the entity to add note to")
             ],
-            entity_type: Annotated[
-                Literal["host", "account"], 
-                Field(description="Type of entity to add note to (host or account)")
-            ],
+            entity_type: EntityType,
             note: Annotated[
                 str, 
                 Field(description="Note text to add to the entity.")
@@ -222,9 +401,6 @@ class InvestigationMCPTools:
             str: Confirmation message with note details.
         """
         try:
-            if entity_type not in ["host", "account"]:
-                raise ValueError("entity_type must be either 'host' or 'account'.")
-            
             params = {}
 
             params["entity_id"] = entity_id
@@ -237,9 +413,10 @@ class InvestigationMCPTools:
             create_note = await self.client.add_entity_note(**params)
 
             # Return note assignment details
-            return json.dumps(create_note, indent=2)
-        except Exception as e:
-            raise Exception(f"Failed to add note to entity {entity_id}: {str(e)}")
+            return _dumps(create_note)
+        except Exception:
+            logger.exception("Failed to add note to entity %s", entity_id)
+            raise
         
     async def mark_detection_fixed(
         self,
@@ -262,20 +439,32 @@ class InvestigationMCPTools:
             Exception: If marking detections fails.
         """
         if not detection_ids:
-            return "No detection IDs provided."
-        
+            return NO_DETECTION_IDS
+
         try:
-            response = await self.client.mark_detection_fixed(detection_ids, mark_fixed)
-            return f"Marked {len(detection_ids)} detections as {'fixed' if mark_fixed else 'not fixed'}."
-        except Exception as e:
-            raise Exception(f"Failed to mark detections: {str(e)}")
+            # Split into chunks and fire them concurrently; wall time is
+            # roughly one chunk's latency instead of one huge request.
+            chunks = [
+                detection_ids[i:i + MARK_FIXED_CHUNK_SIZE]
+                for i in range(0, len(detection_ids), MARK_FIXED_CHUNK_SIZE)
+            ]
+            results = await asyncio.gather(
+                *(self.client.mark_detection_fixed(chunk, mark_fixed) for chunk in chunks),
+                return_exceptions=True
+            )
+            errors = [r for r in results if isinstance(r, Exception)]
+            if errors:
+                raise ExceptionGroup(
+                    f"{len(errors)} of {len(chunks)} detection chunks failed", errors
+                )
+            return MARKED_TEMPLATE.format(n=len(detection_ids), state=self._mark_state[mark_fixed])
+        except Exception:
+            logger.exception("Failed to mark detections")
+            raise
         
     async def delete_assignment(
         self,
-        assignment_id: Annotated[
-            int,
-            Field(ge=1, description="ID of the assignment to delete")
-        ]    
+        assignment_id: Annotated[int, ASSIGNMENT_ID_FIELD]
     ) -> str:
         """
         Unassign or delete an investigation assignment by its ID. Use list_assignments and list_assignments_for_user to fetch assignment IDs.
@@ -287,6 +476,10 @@ class InvestigationMCPTools:
         """
         try:
             await self.client.delete_assignment(assignment_id)
+
+            # Assignments changed; cached lookups are stale
+            self._invalidate_assignment_cache()
             return f"Assignment {assignment_id} deleted successfully."
-        except Exception as e:
-            raise Exception(f"Failed to delete assignment {assignment_id}: {str(e)}")
\ No newline at end of file
+        except Exception:
+            logger.exception("Failed to delete assignment %s", assignment_id)
+            raise
\ No newline at end of file
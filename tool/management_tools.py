@@ -2,8 +2,8 @@
 
 from typing import Literal, Annotated
 from pydantic import Field
-import json
 
+from utils.fast_json import dumps as _dumps
 from utils.validators import validate_date_range
 
 class ManagementMCPTools:
@@ -85,7 +85,7 @@ class ManagementMCPTools:
             user_count = len(user_list)
 
             # Return formatted JSON response
-            return json.dumps({"uer_couclnt": user_count, "user_list": user_list}, indent=2)
+            return _dumps({"uer_couclnt": user_count, "user_list": user_list})
             
         except Exception as e:
             raise Exception(f"Failed to list users : {str(e)}")
@@ -1,6 +1,7 @@
 """MCP tools for response actions."""
 
-import json
+from utils.fast_json import dumps as _dumps
+
 
 class ResponseMCPTools:
     """MCP tools for response actions."""
@@ -34,6 +35,6 @@ class ResponseMCPTools:
             if not lockdown_entities:
                 return "No entities currently in lockdown."
             # Format the response as a JSON string
-            return json.dumps(lockdown_entities, indent=2)
+            return _dumps(lockdown_entities)
         except Exception as e:
             raise Exception(f"Failed to fetch entities in lockdown: {str(e)}")
\ No newline at end of file
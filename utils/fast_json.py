@@ -0,0 +1,40 @@
+"""JSON serialization using the fastest encoder available at import time.
+
+Prefers orjson (C encoder, native datetime/UUID handling), then ujson,
+then the stdlib json module, so every tool shares one consistent encoder
+regardless of what is installed. Output is compact by default; set the
+VECTRA_MCP_PRETTY environment variable for indented, human-readable
+responses.
+"""
+
+import os
+
+_PRETTY = bool(os.environ.get("VECTRA_MCP_PRETTY"))
+
+try:
+    import orjson
+
+    # Naive datetimes are treated as UTC and rendered with a Z suffix via
+    # orjson's C fast path; unknown types fall back to str().
+    _OPTS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+    if _PRETTY:
+        _OPTS |= orjson.OPT_INDENT_2
+
+    def dumps(obj) -> str:
+        """Serialize an object to a JSON string using orjson's C encoder."""
+        return orjson.dumps(obj, default=str, option=_OPTS).decode()
+
+except ImportError:
+    try:
+        import ujson
+
+        def dumps(obj) -> str:
+            """Serialize an object to a JSON string using ujson."""
+            return ujson.dumps(obj, indent=2 if _PRETTY else 0, default=str)
+
+    except ImportError:
+        import json
+
+        def dumps(obj) -> str:
+            """Serialize an object to a JSON string using the stdlib encoder."""
+            return json.dumps(obj, indent=2 if _PRETTY else None, default=str)
@@ -3,7 +3,7 @@
 import asyncio
 import json
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 from urllib.parse import urljoin, urlencode, urlparse, parse_qs
 import base64
 
@@ -41,10 +41,12 @@ class VectraNotFoundError(VectraAPIError):
 class TokenManager:
     """Manages OAuth2 token lifecycle."""
     
-    def __init__(self, client_id: str, client_secret: str, token_url: str):
+    def __init__(self, client_id: str, client_secret: str, token_url: str, http_client: Optional[httpx.AsyncClient] = None):
         self.client_id = client_id
         self.client_secret = client_secret
         self.token_url = token_url
+        # Shared pooled client; falls back to a transient one per refresh
+        self._http_client = http_client
         self._access_token: Optional[str] = None
         self._token_expires_at: Optional[float] = None
         self._token_lock = asyncio.Lock()
@@ -82,38 +84,49 @@ class TokenManager:
         auth_string = self.client_id+':'+self.client_secret
         auth_string_base64 = base64.b64encode(auth_string.encode('ascii'))
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    url=self.token_url,
-                    data=payload,
-                    headers={
-                        "Content-Type": "application/x-www-form-urlencoded", 
-                        'Authorization': 'Basic '+auth_string_base64.decode('ascii')
-                    },
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                
-                token_data = response.json()
-                self._access_token = token_data["access_token"]
-                expires_in = token_data.get("expires_in", 3600)
-                self._token_expires_at = time.time() + expires_in
-                
-                self.logger.info("OAuth2 token refreshed successfully")
-                
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 401:
-                    raise VectraAuthenticationError(
-                        "Invalid OAuth2 credentials",
-                        status_code=401
-                    )
-                raise VectraAPIError(
-                    f"Token refresh failed: {e}",
-                    status_code=e.response.status_code
+        # Reuse the shared connection pool when available instead of paying
+        # TCP+TLS setup on every refresh
+        if self._http_client is not None:
+            client = self._http_client
+            close_client = False
+        else:
+            client = httpx.AsyncClient()
+            close_client = True
+
+        try:
+            response = await client.post(
+                url=self.token_url,
+                data=payload,
+                headers={
+                    "Content-Type": "application/x-www-form-urlencoded",
+                    'Authorization': 'Basic '+auth_string_base64.decode('ascii')
+                },
+                timeout=30.0
+            )
+            response.raise_for_status()
+
+            token_data = response.json()
+            self._access_token = token_data["access_token"]
+            expires_in = token_data.get("expires_in", 3600)
+            self._token_expires_at = time.time() + expires_in
+
+            self.logger.info("OAuth2 token refreshed successfully")
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 401:
+                raise VectraAuthenticationError(
+                    "Invalid OAuth2 credentials",
+                    status_code=401
                 )
-            except Exception as e:
-                raise VectraAPIError(f"Token refresh error: {e}")
+            raise VectraAPIError(
+                f"Token refresh failed: {e}",
+                status_code=e.response.status_code
+            )
+        except Exception as e:
+            raise VectraAPIError(f"Token refresh error: {e}")
+        finally:
+            if close_client:
+                await client.aclose()
 
 
 class RateLimiter:
@@ -154,25 +167,28 @@ class VectraClient:
     def __init__(self, config: VectraConfig):
         self.config = config
         self.logger = get_logger(__name__)
-        
-        # Initialize token manager
+
+        # HTTP client configuration: one long-lived pool per process, with
+        # HTTP/2 so concurrent tool calls multiplex over a single connection
+        self.client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(config.request_timeout),
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+        )
+
+        # Initialize token manager (reuses the shared connection pool)
         self.token_manager = TokenManager(
             client_id=config.client_id,
             client_secret=config.client_secret,
-            token_url=config.oauth_token_url
+            token_url=config.oauth_token_url,
+            http_client=self.client
         )
-        
+
         # Initialize rate limiter
         self.rate_limiter = RateLimiter(
             requests_per_period=config.rate_limit_requests,
             period=config.rate_limit_period
         )
-        
-        # HTTP client configuration
-        self.client = httpx.AsyncClient(
-            timeout=httpx.Timeout(config.request_timeout),
-            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5)
-        )
     
     async def __aenter__(self):
         return self
@@ -366,6 +382,74 @@ class VectraClient:
             "results": all_results
         }
     
+    async def _iter_pages(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        max_pages: int = 1000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield pages from a paginated endpoint one at a time.
+
+        Streaming counterpart to _get_all_pages: each page envelope is
+        yielded as soon as it arrives, so callers can process results
+        incrementally instead of buffering the whole collection.
+
+        Args:
+            endpoint: API endpoint to call
+            params: Query parameters for the request
+            max_pages: Maximum number of pages to fetch (safety limit)
+
+        Yields:
+            Dict with the single-page response structure.
+        """
+        if params is None:
+            params = {}
+
+        current_params = params.copy()
+        pages_fetched = 0
+
+        # Remove any existing page parameter to start from page 1
+        current_params.pop("page", None)
+
+        self.logger.debug(f"Starting page iteration for {endpoint}")
+
+        while pages_fetched < max_pages:
+            response = await self._make_request("GET", endpoint, params=current_params)
+
+            # Check if this is a paginated response
+            if not isinstance(response, dict) or "results" not in response:
+                # Not a paginated response, yield as-is
+                yield response
+                return
+
+            pages_fetched += 1
+            self.logger.debug(f"Yielding page {pages_fetched} with {len(response.get('results', []))} items")
+            yield response
+
+            # Check if there's a next page
+            next_url = response.get("next")
+            if not next_url:
+                return
+
+            # Extract page number from next URL
+            try:
+                parsed_url = urlparse(next_url)
+                query_params = parse_qs(parsed_url.query)
+                next_page = query_params.get("page", [None])[0]
+
+                if next_page:
+                    current_params["page"] = int(next_page)
+                else:
+                    # No page parameter in next URL, stop to avoid infinite loop
+                    return
+
+            except (ValueError, TypeError) as e:
+                self.logger.warning(f"Could not parse next page URL: {next_url}, error: {e}")
+                return
+
+        self.logger.warning(f"Reached maximum page limit ({max_pages}) for {endpoint}")
+
     # Account endpoints
     async def get_accounts(
         self,
@@ -564,6 +648,7 @@ class VectraClient:
         page_size: Optional[int] = None,
         ordering: Optional[str] = None,
         resolved: Optional[bool] = None,
+        fields: Optional[str] = None,
         auto_paginate: bool = False,
         **kwargs
     ) -> Dict[str, Any]:
@@ -573,6 +658,7 @@ class VectraClient:
             "page_size": page_size,
             "ordering": ordering,
             "resolved": resolved,
+            "fields": fields,
             **kwargs
         }.items() if v is not None}
         
@@ -581,6 +667,26 @@ class VectraClient:
         else:
             return await self._make_request("GET", "assignments", params=params)
     
+    async def iter_assignments(
+        self,
+        page_size: Optional[int] = None,
+        ordering: Optional[str] = None,
+        resolved: Optional[bool] = None,
+        fields: Optional[str] = None,
+        **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield assignment pages one at a time with filtering."""
+        params = {k: v for k, v in {
+            "page_size": page_size,
+            "ordering": ordering,
+            "resolved": resolved,
+            "fields": fields,
+            **kwargs
+        }.items() if v is not None}
+
+        async for page in self._iter_pages("assignments", params):
+            yield page
+
     async def get_assignment(self, assignment_id: int) -> Dict[str, Any]:
         """Get specific assignment by ID."""
         return await self._make_request("GET", f"assignments/{assignment_id}")